@@ -1,101 +1,226 @@
 import os
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import random
-import json
+import shutil
+import argparse
+from urllib.parse import urlsplit
+import multiprocessing
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, StaleElementReferenceException
-from openpyxl import Workbook, load_workbook
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from selenium.common.exceptions import (
+    TimeoutException, WebDriverException, InvalidSessionIdException, NoSuchWindowException
+)
+import xlsxwriter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
 from datetime import datetime
-import pandas as pd
-
+from functools import lru_cache
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scraper.log'),
-        logging.StreamHandler()
-    ]
-)
 
 # Configuration
 CONFIG = {
     'TIMEOUT': 30,              # Timeout for page loading
     'MAX_RETRIES': 3,           # Maximum number of retries
-    'WAIT_TIME': 5,             # Wait time for page to load completely
+    'TOTAL_BUDGET': 180,        # Overall time limit per URL across all retries (seconds)
+    'BRANDS_PER_PAGE': 10,      # Brand rows extracted from each page
+    'ROWS_SETTLE_TIME': 5,      # Max wait for a partly rendered page to fill once rows appear
+    'PAGES': 2,                 # Pages scraped per category (override with --pages)
+    'MAX_WORKERS': 4,           # Maximum Chrome processes when scraping several URLs
     'OUTPUT_FILE': 'euka_brands_data.xlsx'
 }
 
-def save_to_excel(data):
+# ChromeDriver and profile paths, resolved once at import time
+BASE_DIR = os.path.dirname(__file__)
+DRIVER_PATH = os.path.join(BASE_DIR, "chromedriver-win64", "chromedriver.exe")
+SCRIPT_USER_DATA_DIR = os.path.join(BASE_DIR, "chrome_profile_6")
+MAIN_USER_DATA_DIR = os.path.join(os.path.expanduser("~"), "AppData", "Local", "Google", "Chrome", "User Data")
+MAIN_PROFILE_6_DIR = os.path.join(MAIN_USER_DATA_DIR, "Profile 6")
+MAIN_LOCAL_STATE = os.path.join(MAIN_USER_DATA_DIR, "Local State")
+
+# User agent picked once per process so retries don't present a different browser each time
+USER_AGENT = f"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{random.randint(90, 100)}.0.0.0 Safari/537.36"
+
+# Set once the script's profile directory has been prepared
+_profile_ready = False
+
+# Process-pool worker slot; each slot uses its own copy of the Chrome profile
+_worker_slot = 0
+
+# Chrome workers are always spawned fresh rather than forked from the main process
+MP_CONTEXT = multiprocessing.get_context('spawn')
+
+# Configure logging: records are queued and written by a QueueListener thread in the
+# main process, so file/console I/O stays off the scraping path (pool workers share the queue)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+logger = logging.getLogger(__name__)
+
+# Queue this process logs to, set by configure_logging
+_log_queue = None
+
+def configure_logging(log_queue, level=logging.INFO):
+    """
+    Routes this process's log records to log_queue (main process and every pool worker).
+    Only this script's logger follows level; the root logger, and with it Selenium and
+    urllib3, stays at INFO.
+    """
+    global _log_queue
+    _log_queue = log_queue
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+    logger.setLevel(level)
+
+
+def start_log_listener(log_queue):
     """
-    Saves brand data to Excel file (saves all brands from both pages).
+    Starts the listener that writes queued records to scraper.log and the console.
     """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler('scraper.log'), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
+
+# Selectors for the brands table, defined once and reused for every lookup
+ROW_CSS = "tr.group"
+BTN_CSS = "td button"
+TD_CSS = "td"
+ROW_LOCATOR = (By.CSS_SELECTOR, ROW_CSS)
+PAGE_BUTTON_XPATH = "//button[text()='{}']"  # Paginator button, formatted with the page number
+
+# Scripts take ROW_CSS, BTN_CSS and TD_CSS as arguments[0..2]
+EXTRACT_ROWS_JS = """
+    return Array.from(document.querySelectorAll(arguments[0])).map(row => {
+        const tds = row.querySelectorAll(arguments[2]);
+        const button = row.querySelector(arguments[1]);
+        return [
+            button ? button.innerText.trim() : '',
+            tds.length >= 2 ? tds[1].innerText.trim() : 'N/A',
+            tds.length >= 3 ? tds[2].innerText.trim() : 'N/A'
+        ];
+    });
+"""
+# First non-empty brand name, picked the same way EXTRACT_ROWS_JS reads rows (null if none)
+FIRST_BRAND_JS = """
+    for (const row of document.querySelectorAll(arguments[0])) {
+        const button = row.querySelector(arguments[1]);
+        const name = button ? button.innerText.trim() : '';
+        if (name) return name;
+    }
+    return null;
+"""
+
+def save_to_excel(data, output_file=None):
+    """
+    Saves brand data to Excel file (saves all brands from every scraped page).
+    """
+    output_file = output_file or CONFIG['OUTPUT_FILE']
     try:
-        wb = Workbook()
-        ws = wb.active
+        # constant_memory streams each row to disk as soon as it is written
+        wb = xlsxwriter.Workbook(output_file, {'constant_memory': True})
+        ws = wb.add_worksheet('Brands')
         
         # Add headers
-        ws.append(['Brand Name', 'Number of Products', 'Total Sales', 'Extraction Time'])
+        ws.write_row(0, 0, ['Brand Name', 'Number of Products', 'Total Sales', 'Extraction Time'])
         
-        # Add data with timestamp (save all brands from both pages)
+        # Add data with timestamp (save all brands from every scraped page)
         current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        for brand_name, num_products, total_sales in data:
-            ws.append([brand_name, num_products, total_sales, current_time])
+        write_row = ws.write_row  # Bind once; avoids the attribute lookup per row
+        for row_index, row in enumerate(data, 1):
+            write_row(row_index, 0, (*row, current_time))
             
-        wb.save(CONFIG['OUTPUT_FILE'])
-        logging.info(f"Saved {len(data)} brands to {CONFIG['OUTPUT_FILE']}")
+        wb.close()
+        logger.info(f"Saved {len(data)} brands to {output_file}")
 
     except Exception as e:
-        logging.error(f"Error saving Excel file: {str(e)}")
+        logger.error(f"Error saving Excel file: {str(e)}")
         raise
 
 
 
-def setup_driver():
+def _init_worker(slots, log_queue, log_level):
     """
-    Sets up and returns a configured Chrome WebDriver using Chrome profile 6.
+    Process-pool initializer: claims a worker slot so each worker gets its own Chrome user data directory.
     """
-    # Use the ChromeDriver in the project folder
-    driver_path = os.path.join(os.path.dirname(__file__), "chromedriver-win64", "chromedriver.exe")
-    
-    if not os.path.exists(driver_path):
-        raise Exception(f"ChromeDriver not found at: {driver_path}")
-    
-    logging.info(f"Using ChromeDriver: {driver_path}")
-    
-    service = Service(driver_path)
-    options = webdriver.ChromeOptions()
+    global _worker_slot
+    if log_queue is not None:
+        configure_logging(log_queue, log_level)
+    _worker_slot = slots.get()
+
+
+def _user_data_dir():
+    """
+    Returns this process's Chrome user data directory (slot 0 keeps the original chrome_profile_6).
+    """
+    if _worker_slot == 0:
+        return SCRIPT_USER_DATA_DIR
+    return f"{SCRIPT_USER_DATA_DIR}_{_worker_slot}"
+
+
+def _ensure_profile():
+    """
+    Creates this process's Chrome user data directory and copies Profile 6 into it (once per process).
+    """
+    global _profile_ready
+    if _profile_ready:
+        return
     
     # Create a separate user data directory for this script to avoid conflicts
-    script_user_data_dir = os.path.join(os.path.dirname(__file__), "chrome_profile_6")
-    os.makedirs(script_user_data_dir, exist_ok=True)
-    
-    # Copy profile 6 from the main Chrome user data if it exists
-    main_user_data_dir = os.path.expanduser("~\\AppData\\Local\\Google\\Chrome\\User Data")
-    main_profile_6_dir = os.path.join(main_user_data_dir, "Profile 6")
-    script_profile_6_dir = os.path.join(script_user_data_dir, "Profile 6")
+    user_data_dir = _user_data_dir()
+    script_profile_6_dir = os.path.join(user_data_dir, "Profile 6")
+    os.makedirs(user_data_dir, exist_ok=True)
     
-    if os.path.exists(main_profile_6_dir) and not os.path.exists(script_profile_6_dir):
-        import shutil
+    # Copy profile 6 from the main Chrome user data if this slot has none yet. Every slot keeps
+    # its own private copy, so no two Chrome instances (the user's own included) share a
+    # profile; an existing copy is never touched, so logins made inside it are kept.
+    if os.path.exists(MAIN_PROFILE_6_DIR) and not os.path.exists(script_profile_6_dir):
         try:
-            shutil.copytree(main_profile_6_dir, script_profile_6_dir)
-            logging.info(f"Copied Profile 6 from main Chrome to script directory")
+            # Caches and service worker storage are not needed for the login state
+            shutil.copytree(
+                MAIN_PROFILE_6_DIR, script_profile_6_dir,
+                ignore=shutil.ignore_patterns('*Cache*', 'Service Worker')
+            )
+            # Local State holds the key that decrypts the copied cookies
+            local_state = os.path.join(user_data_dir, "Local State")
+            if os.path.exists(MAIN_LOCAL_STATE) and not os.path.exists(local_state):
+                shutil.copy2(MAIN_LOCAL_STATE, local_state)
+            logger.info(f"Copied Profile 6 from main Chrome to {user_data_dir}")
         except Exception as e:
-            logging.warning(f"Could not copy Profile 6: {str(e)}")
+            logger.warning(f"Could not copy Profile 6: {str(e)}")
+    
+    _profile_ready = True
+
+
+@lru_cache(maxsize=None)
+def _chrome_options():
+    """
+    Builds the Chrome options once; every driver created by this process reuses them.
+    """
+    options = webdriver.ChromeOptions()
     
     # Use the script-specific user data directory
-    options.add_argument(f"--user-data-dir={script_user_data_dir}")
+    options.add_argument(f"--user-data-dir={_user_data_dir()}")
     options.add_argument("--profile-directory=Profile 6")
     
+    # Run headless and skip images - only the table text is needed. CSS stays enabled:
+    # innerText depends on computed style, so hidden helper text must stay hidden.
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")  # Headless has no screen to maximize to
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2
+    })
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-extensions")
+
     # Other Chrome options
-    options.add_argument("--start-maximized")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
@@ -106,169 +231,277 @@ def setup_driver():
     options.add_argument("--disable-blink-features=AutomationControlled")  # Hide automation
     options.add_experimental_option("excludeSwitches", ["enable-automation"])  # Hide automation
     options.add_experimental_option('useAutomationExtension', False)  # Hide automation
-    options.add_argument(f"user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{random.randint(90, 100)}.0.0.0 Safari/537.36")
+    options.add_argument(f"user-agent={USER_AGENT}")
     
-    logging.info(f"Using Chrome profile 6 from: {script_user_data_dir}")
+    return options
+
+
+def setup_driver():
+    """
+    Sets up and returns a configured Chrome WebDriver using Chrome profile 6.
+    """
+    # Use the ChromeDriver in the project folder
+    if not os.path.exists(DRIVER_PATH):
+        raise Exception(f"ChromeDriver not found at: {DRIVER_PATH}")
     
-    return webdriver.Chrome(service=service, options=options)
+    logger.info(f"Using ChromeDriver: {DRIVER_PATH}")
+    
+    _ensure_profile()
+    logger.info(f"Using Chrome profile 6 from: {_user_data_dir()}")
+    
+    return webdriver.Chrome(service=Service(DRIVER_PATH), options=_chrome_options())
 
 
 
-def scrape_euka_brands(url):
+def _session_alive(driver, error):
+    """
+    Returns False when error (or a cheap probe) shows the browser session has been lost.
+    """
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return False
+    try:
+        driver.title
+        return True
+    except WebDriverException:
+        return False
+
+
+def _rows_settled(driver, row_counts):
+    """
+    Wait condition: true once a full page of rows is present or the count matches the previous poll.
+    """
+    row_counts.append(len(driver.find_elements(*ROW_LOCATOR)))
+    if row_counts[-1] >= CONFIG['BRANDS_PER_PAGE']:
+        return True
+    return len(row_counts) >= 2 and row_counts[-1] == row_counts[-2]
+
+
+def scrape_euka_brands(url, output_file=None, pages=None):
     """
     Scrapes brand information from Euka website across multiple pages.
     """
+    pages = pages or CONFIG['PAGES']
     driver = None
     retry_count = 0
+    deadline = time.monotonic() + CONFIG['TOTAL_BUDGET']
     
-    while retry_count < CONFIG['MAX_RETRIES']:
-        try:
-            driver = setup_driver()
-            logging.info(f"Starting scraping for Euka brands from: {url}")
-            
-            # Load initial page with retries
+    try:
+        while retry_count < CONFIG['MAX_RETRIES']:
             try:
-                driver.get(url)
-                logging.info("Page loaded, waiting for content to appear...")
-                
-                # Wait for the page to load completely
-                time.sleep(CONFIG['WAIT_TIME'])
+                # Keep the browser alive across retries; only start a new one when needed
+                if driver is None:
+                    driver = setup_driver()
+                logger.info(f"Starting scraping for Euka brands from: {url}")
+            
+                # Load initial page with retries
+                try:
+                    driver.get(url)
+                    logger.info("Page loaded, waiting for content to appear...")
                 
-                # Wait for table rows to be present
-                WebDriverWait(driver, CONFIG['TIMEOUT']).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "tr.group"))
-                )
+                    # Wait for table rows to be present
+                    WebDriverWait(driver, CONFIG['TIMEOUT']).until(
+                        lambda d: d.find_elements(*ROW_LOCATOR)
+                    )
+                    
+                    # Then give the rest of the page a short, bounded chance to render: stop at a
+                    # full page or as soon as the row count holds steady (smaller categories)
+                    row_counts = []
+                    try:
+                        WebDriverWait(driver, CONFIG['ROWS_SETTLE_TIME'], poll_frequency=0.25).until(
+                            lambda d: _rows_settled(d, row_counts)
+                        )
+                    except TimeoutException:
+                        logger.warning("Row count still changing, continuing with the rows present")
                 
-                logging.info("Page loaded successfully, starting extraction...")
+                    logger.info("Page loaded successfully, starting extraction...")
                 
-            except TimeoutException:
-                retry_count += 1
-                logging.warning(f"Timeout loading page, retry {retry_count}/{CONFIG['MAX_RETRIES']}")
-                if retry_count == CONFIG['MAX_RETRIES']:
-                    raise Exception("Failed to load page after maximum retries")
-                continue
+                except TimeoutException:
+                    retry_count += 1
+                    logger.warning(f"Timeout loading page, retry {retry_count}/{CONFIG['MAX_RETRIES']}")
+                    if retry_count == CONFIG['MAX_RETRIES']:
+                        raise Exception("Failed to load page after maximum retries")
+                    if time.monotonic() > deadline:
+                        raise Exception("Failed to load page within the time budget")
+                    continue
             
-            # Extract brand data from multiple pages
-            all_brands_data = []
+                # Extract brand data from multiple pages
+                all_brands_data = []
             
-            # Scrape page 1
-            logging.info("=== Scraping Page 1 ===")
-            page1_data = extract_brands_from_current_page(driver)
-            all_brands_data.extend(page1_data)
-            logging.info(f"Page 1: Extracted {len(page1_data)} brands")
+                # Scrape page 1
+                logger.info("=== Scraping Page 1 ===")
+                page1_data = extract_brands_from_current_page(driver)
+                all_brands_data.extend(page1_data)
+                logger.info(f"Page 1: Extracted {len(page1_data)} brands")
             
-            # Navigate to page 2
-            try:
-                logging.info("=== Navigating to Page 2 ===")
-                page2_button = driver.find_element(By.XPATH, "//button[text()='2']")
-                page2_button.click()
-                
-                # Wait for page 2 to load
-                time.sleep(CONFIG['WAIT_TIME'])
-                
-                # Wait for table rows to be present on page 2
-                WebDriverWait(driver, CONFIG['TIMEOUT']).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "tr.group"))
-                )
-                
-                logging.info("Page 2 loaded successfully")
-                
-                # Scrape page 2
-                logging.info("=== Scraping Page 2 ===")
-                page2_data = extract_brands_from_current_page(driver)
-                all_brands_data.extend(page2_data)
-                logging.info(f"Page 2: Extracted {len(page2_data)} brands")
-                
-            except Exception as e:
-                logging.warning(f"Could not navigate to page 2: {str(e)}")
-                logging.info("Continuing with page 1 data only")
+                # Navigate through the remaining pages
+                for page in range(2, pages + 1):
+                    try:
+                        logger.info(f"=== Navigating to Page {page} ===")
+                        # Read the current first brand with the same script the wait below polls
+                        previous_first_brand = driver.execute_script(FIRST_BRAND_JS, ROW_CSS, BTN_CSS)
+                        page_button = driver.find_element(By.XPATH, PAGE_BUTTON_XPATH.format(page))
+                        page_button.click()
+                    
+                        # Previous page's rows stay in the DOM until the table re-renders, so
+                        # wait for the first brand to change rather than for rows to exist
+                        WebDriverWait(driver, CONFIG['TIMEOUT'], poll_frequency=0.1).until(
+                            lambda d: d.execute_script(FIRST_BRAND_JS, ROW_CSS, BTN_CSS)
+                            not in (None, previous_first_brand)
+                        )
+                    
+                        logger.info(f"Page {page} loaded successfully")
+                    
+                        # Scrape this page
+                        logger.info(f"=== Scraping Page {page} ===")
+                        page_data = extract_brands_from_current_page(driver)
+                        all_brands_data.extend(page_data)
+                        logger.info(f"Page {page}: Extracted {len(page_data)} brands")
+                    
+                    except Exception as e:
+                        logger.warning(f"Could not navigate to page {page}: {str(e)}")
+                        logger.info(f"Continuing with data from the first {page - 1} page(s)")
+                        break
             
-            logging.info(f"Total brands extracted: {len(all_brands_data)}")
+                logger.info(f"Total brands extracted: {len(all_brands_data)}")
             
-            # Save to Excel
-            if all_brands_data:
-                save_to_excel(all_brands_data)
-                return len(all_brands_data)
-            else:
-                raise Exception("No brand data found on any page")
+                # Save to Excel
+                if all_brands_data:
+                    save_to_excel(all_brands_data, output_file)
+                    return len(all_brands_data)
+                else:
+                    raise Exception("No brand data found on any page")
                 
-        except Exception as e:
-            retry_count += 1
-            logging.error(f"Error scraping {url} (attempt {retry_count}): {str(e)}")
-            if retry_count < CONFIG['MAX_RETRIES']:
-                logging.info("Retrying...")
-                time.sleep(5)
-            else:
-                logging.error(f"Max retries reached for {url}")
-                raise
-        finally:
-            if driver:
-                driver.quit()
+            except Exception as e:
+                retry_count += 1
+                logger.error(f"Error scraping {url} (attempt {retry_count}): {str(e)}")
+                if retry_count < CONFIG['MAX_RETRIES'] and time.monotonic() < deadline:
+                    # Only start a fresh browser when the session itself is gone; script,
+                    # lookup and timeout errors retry on the same driver
+                    if driver and not _session_alive(driver, e):
+                        try:
+                            driver.quit()
+                        except Exception:
+                            pass
+                        driver = None
+                    # Exponential backoff (1s, 2s, 4s... capped at 8s), never past the deadline
+                    delay = min(2 ** retry_count * 0.5, 8, max(deadline - time.monotonic(), 0))
+                    logger.info(f"Retrying in {delay:.1f}s...")
+                    time.sleep(delay)
+                else:
+                    logger.error(f"Max retries or time budget reached for {url}")
+                    raise
+    finally:
+        if driver:
+            driver.quit()
 
 def extract_brands_from_current_page(driver):
     """
-    Extracts brand data from the current page (limited to 10 brands).
+    Extracts brand data from the current page (limited to BRANDS_PER_PAGE brands).
     """
     brands_data = []
     
-    # Find the specific table with "Brands featuring this category" title
-    # Look for the table that contains the brands data
-    table_rows = driver.find_elements(By.CSS_SELECTOR, "tr.group")
-    logging.info(f"Found {len(table_rows)} total table rows on current page")
+    # Pull every row's cell text in a single script call instead of one
+    # WebDriver round trip per element
+    rows = driver.execute_script(EXTRACT_ROWS_JS, ROW_CSS, BTN_CSS, TD_CSS)
+    logger.info(f"Found {len(rows)} total table rows on current page")
     
-    # Limit to first 10 brand rows only
-    count = 0
-    for row in table_rows:
-        if count >= 10:  # Only extract first 10 brands
+    # Limit to the first BRANDS_PER_PAGE brand rows only
+    for brand_name, num_products, total_sales in rows:
+        if len(brands_data) >= CONFIG['BRANDS_PER_PAGE']:
             break
-            
-        try:
-            # Extract brand name (first td with button)
-            brand_button = row.find_element(By.CSS_SELECTOR, "td button")
-            brand_name = brand_button.text.strip()
-            
-            # Extract number of products (second td)
-            tds = row.find_elements(By.CSS_SELECTOR, "td")
-            if len(tds) >= 2:
-                num_products = tds[1].text.strip()
-            else:
-                num_products = "N/A"
-            
-            # Extract total sales (third td)
-            if len(tds) >= 3:
-                total_sales = tds[2].text.strip()
-            else:
-                total_sales = "N/A"
-            
-            if brand_name:
-                brands_data.append((brand_name, num_products, total_sales))
-                logging.info(f"Extracted: {brand_name} - {num_products} products - {total_sales}")
-                count += 1
-            
-        except Exception as e:
-            logging.warning(f"Error extracting data from row: {str(e)}")
-            continue
+        
+        if brand_name:
+            brands_data.append((brand_name, num_products, total_sales))
+            logger.debug(f"Extracted: {brand_name} - {num_products} products - {total_sales}")
     
     return brands_data
 
+def output_file_for(url):
+    """
+    Returns the per-category Excel file used when scraping several URLs, e.g. euka_brands_data_7.xlsx for .../categories/7.
+    Raises ValueError if the URL path does not end in a numeric category id.
+    """
+    category_id = urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]
+    if not (category_id.isascii() and category_id.isdigit()):
+        raise ValueError(f"Not a category URL (expected .../categories/<id>): {url}")
+    
+    base, ext = os.path.splitext(CONFIG['OUTPUT_FILE'])
+    return f"{base}_{category_id}{ext}"
+
+
+def scrape_multiple_urls(urls, pages=None):
+    """
+    Scrapes several category URLs in parallel, one Chrome instance per worker process.
+    """
+    # Selenium does not play well with threads, so each worker is a separate process
+    max_workers = min(CONFIG['MAX_WORKERS'], len(urls))
+    slots = MP_CONTEXT.Queue()
+    for slot in range(max_workers):
+        slots.put(slot)
+    
+    total_count = 0
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=MP_CONTEXT, initializer=_init_worker,
+        initargs=(slots, _log_queue, logger.level)
+    ) as executor:
+        futures = {executor.submit(scrape_euka_brands, u, output_file_for(u), pages): u for u in urls}
+        for future in as_completed(futures):
+            try:
+                count = future.result()
+                total_count += count
+                logger.info(f"Successfully extracted data for {count} brands from {futures[future]}")
+            except Exception as e:
+                logger.error(f"Failed to scrape brands from {futures[future]}: {str(e)}")
+    
+    return total_count
+
 # URL to scrape
 url = "https://app.euka.ai/social-intelligence/categories/7"
 
 if __name__ == "__main__":
-    logging.info("Starting Euka brand extraction process")
-    logging.info(f"Target URL: {url}")
+    parser = argparse.ArgumentParser(description="Extract brand data from Euka category pages")
+    parser.add_argument("urls", nargs="*", default=[url], help="Category URLs to scrape (default: category 7)")
+    parser.add_argument("--pages", type=int, default=CONFIG['PAGES'], help="Pages to scrape per category (default: %(default)s)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every extracted row (DEBUG for this script only)")
+    args = parser.parse_args()
+    if args.pages < 1:
+        parser.error("--pages must be at least 1")
+    
+    # A single URL writes OUTPUT_FILE; several get one file per category, so several
+    # spellings of one category (.../7, .../7/, query strings) are scraped only once
+    urls = args.urls
+    if len(urls) > 1:
+        targets = {}
+        for target_url in urls:
+            try:
+                targets.setdefault(output_file_for(target_url), target_url)
+            except ValueError as e:
+                parser.error(str(e))
+        urls = list(targets.values())
+    
+    log_queue = MP_CONTEXT.Queue()
+    log_listener = start_log_listener(log_queue)
+    configure_logging(log_queue, logging.DEBUG if args.verbose else logging.INFO)
+    
+    logger.info("Starting Euka brand extraction process")
+    logger.info(f"Target URLs: {', '.join(urls)}")
     
     start_time = time.time()
     
-    try:
-        count = scrape_euka_brands(url)
-        logging.info(f"Successfully extracted data for {count} brands")
-    except Exception as e:
-        logging.error(f"Failed to scrape brands: {str(e)}")
+    if len(urls) == 1:
+        try:
+            count = scrape_euka_brands(urls[0], pages=args.pages)
+            logger.info(f"Successfully extracted data for {count} brands")
+        except Exception as e:
+            logger.error(f"Failed to scrape brands: {str(e)}")
+    else:
+        count = scrape_multiple_urls(urls, args.pages)
+        logger.info(f"Extracted data for {count} brands across {len(urls)} URLs")
     
     end_time = time.time()
     total_time = end_time - start_time
     minutes = int(total_time // 60)
     seconds = total_time % 60
     
-    logging.info(f"\nTotal execution time: {minutes}m {seconds:.2f}s")
\ No newline at end of file
+    logger.info(f"\nTotal execution time: {minutes}m {seconds:.2f}s")
+    log_listener.stop()